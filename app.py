@@ -61,6 +61,12 @@ try:
     from datetime import datetime
     from functools import wraps
     import json
+    import click
+    from flask import Response, stream_with_context
+    from pymongo import ReplaceOne
+    from pymongo.errors import BulkWriteError
+    from bson import BSON, decode_file_iter, json_util
+    from bson.errors import BSONError
     print("✓ All modules imported successfully")
 except Exception as e:
     print(f"✗ Import error: {e}")
@@ -253,9 +259,163 @@ def get_guild_channels(guild_id):
         print(f"Error getting guild channels: {e}")
     return []
 
+def user_is_owner(user_id):
+    """Check if user is one of the bot owners (fleet-wide operations)"""
+    try:
+        return int(user_id) in OWNERS
+    except (TypeError, ValueError):
+        return False
+
+def normalize_config_for_storage(config_data):
+    """Normalize a guild config the same way the dashboard does before saving.
+
+    Empty values are dropped and role/channel/group ID fields are coerced to int.
+    """
+    # Filter out empty values - only save non-empty configuration
+    filtered_config = {}
+    for key, value in config_data.items():
+        if value is not None and value != "" and value != []:
+            # Convert string numbers to integers for role/channel IDs
+            if key.endswith(('_id', '_role_id', '_channel_id', 'RoleID', 'CategoryID', 'LOGS_ID', 'CHANNEL_ID', 'GROUP_ID', 'RANK_ID')):
+                try:
+                    if isinstance(value, str) and value.isdigit():
+                        filtered_config[key] = int(value)
+                    elif isinstance(value, (int, float)):
+                        filtered_config[key] = int(value)
+                    else:
+                        filtered_config[key] = value
+                except (ValueError, TypeError):
+                    filtered_config[key] = value
+            else:
+                filtered_config[key] = value
+    return filtered_config
+
+# Config export/import (backup and migration)
+CONFIG_TRANSFER_FORMATS = ('ndjson', 'bson')
+CONFIG_EXPORT_BATCH_SIZE = 500
+CONFIG_IMPORT_BATCH_SIZE = 500
+CONFIG_IMPORT_MIMETYPES = {'application/x-ndjson': 'ndjson', 'application/bson': 'bson'}
+
+def iter_config_export(fmt='ndjson', guild_ids=None):
+    """Yield guild configs one document at a time as NDJSON lines or BSON documents.
+
+    Reads through a batched cursor so the collection is never loaded into memory.
+    NDJSON uses MongoDB relaxed extended JSON so dates survive a round trip.
+    """
+    query = {'guild_id': {'$in': [str(g) for g in guild_ids]}} if guild_ids else {}
+    cursor = db.guild_configs.find(query, {'_id': 0}, batch_size=CONFIG_EXPORT_BATCH_SIZE)
+    try:
+        for doc in cursor:
+            if fmt == 'bson':
+                yield BSON.encode(doc)
+            else:
+                yield json_util.dumps(doc, json_options=json_util.RELAXED_JSON_OPTIONS) + '\n'
+    finally:
+        cursor.close()
+
+class ConfigImportError(ValueError):
+    """Raised when an import stream contains a document that cannot be decoded or written."""
+
+# json_util/bson raise a mix of these for malformed documents and extended-JSON wrappers
+CONFIG_DECODE_ERRORS = (ValueError, TypeError, IndexError, BSONError)
+
+def iter_config_import_documents(stream, fmt='ndjson'):
+    """Yield config documents from a binary NDJSON or BSON stream.
+
+    Decode errors are re-raised as ConfigImportError naming the failing line/document.
+    """
+    if fmt == 'bson':
+        position = 0
+        try:
+            for position, doc in enumerate(decode_file_iter(stream), 1):
+                yield doc
+        except CONFIG_DECODE_ERRORS as e:
+            raise ConfigImportError(f"Invalid BSON at document {position + 1}: {e}")
+        return
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            doc = json_util.loads(line)
+        except CONFIG_DECODE_ERRORS as e:
+            raise ConfigImportError(f"Invalid JSON on line {line_number}: {e}")
+        if not isinstance(doc, dict):
+            raise ConfigImportError(f"Line {line_number} is not a JSON object")
+        yield doc
+
+def import_configs(documents):
+    """Replace config documents keyed by guild_id using batched bulk writes.
+
+    Every document is normalized like a dashboard save and written with a
+    replace-upsert, so importing a backup restores each guild to exactly the
+    backed-up state and importing the same export twice is a no-op. Within a
+    batch the last document read for a guild wins.
+
+    Stops at the first undecodable document or failed batch; everything read
+    before that point is still written and the reason is reported in 'error'.
+    """
+    stats = {'processed': 0, 'skipped': 0, 'matched': 0, 'modified': 0, 'upserted': 0, 'error': None}
+    batch = {}
+
+    def flush():
+        try:
+            result = db.guild_configs.bulk_write(list(batch.values()), ordered=False)
+            stats['matched'] += result.matched_count
+            stats['modified'] += result.modified_count
+            stats['upserted'] += result.upserted_count
+        except BulkWriteError as e:
+            details = e.details
+            stats['matched'] += details.get('nMatched', 0)
+            stats['modified'] += details.get('nModified', 0)
+            stats['upserted'] += details.get('nUpserted', 0)
+            raise ConfigImportError(f"Bulk write failed with {len(details.get('writeErrors', []))} write errors")
+        except Exception as e:
+            raise ConfigImportError(f"Bulk write failed: {e}")
+        finally:
+            batch.clear()
+
+    try:
+        for doc in documents:
+            doc.pop('_id', None)
+            guild_id = str(doc.get('guild_id') or '')
+            # Top-level $ keys are rejected by replace operations
+            if not guild_id.isdigit() or any(str(key).startswith('$') for key in doc):
+                stats['skipped'] += 1
+                continue
+            config = normalize_config_for_storage(doc)
+            config['guild_id'] = guild_id  # Ensure string consistency
+            batch[guild_id] = ReplaceOne({'guild_id': guild_id}, config, upsert=True)
+            stats['processed'] += 1
+            if len(batch) >= CONFIG_IMPORT_BATCH_SIZE:
+                flush()
+    except ConfigImportError as e:
+        stats['error'] = str(e)
+    try:
+        if batch:
+            flush()
+    except ConfigImportError as e:
+        stats['error'] = stats['error'] or str(e)
+    return stats
+
+def get_transfer_format():
+    """Resolve the import format strictly from the request Content-Type.
+
+    Only non-form content types are accepted so a cross-site form post cannot
+    trigger an import without a CORS preflight.
+    """
+    return CONFIG_IMPORT_MIMETYPES.get(request.mimetype)
+
+def get_requested_guild_ids():
+    """Collect guild IDs from repeated or comma-separated guild_id query args."""
+    guild_ids = []
+    for value in request.args.getlist('guild_id'):
+        guild_ids.extend(x.strip() for x in value.split(',') if x.strip())
+    return guild_ids
+
 def user_can_manage_guild(user_id, guild_id, user_guilds):
     """Check if user can manage the guild (owner or administrator)"""
-    if int(user_id) in OWNERS:
+    if user_is_owner(user_id):
         return True
     
     for guild in user_guilds:
@@ -571,23 +731,7 @@ def save_config(guild_id):
         if not config_data:
             return jsonify({'success': False, 'message': 'No configuration data received'}), 400
         
-        # Filter out empty values - only save non-empty configuration
-        filtered_config = {}
-        for key, value in config_data.items():
-            if value is not None and value != "" and value != []:
-                # Convert string numbers to integers for role/channel IDs
-                if key.endswith(('_id', '_role_id', '_channel_id', 'RoleID', 'CategoryID', 'LOGS_ID', 'CHANNEL_ID', 'GROUP_ID', 'RANK_ID')):
-                    try:
-                        if isinstance(value, str) and value.isdigit():
-                            filtered_config[key] = int(value)
-                        elif isinstance(value, (int, float)):
-                            filtered_config[key] = int(value)
-                        else:
-                            filtered_config[key] = value
-                    except (ValueError, TypeError):
-                        filtered_config[key] = value
-                else:
-                    filtered_config[key] = value
+        filtered_config = normalize_config_for_storage(config_data)
             
         print(f"Saving config for guild {guild_id}: {len(filtered_config)} non-empty fields")
         filtered_config['guild_id'] = str(guild_id)  # Ensure string consistency
@@ -610,6 +754,52 @@ def save_config(guild_id):
         traceback.print_exc()
         return jsonify({'success': False, 'message': str(e)}), 500
 
+@app.route('/export_configs')
+@login_required
+def export_configs():
+    if not user_is_owner(session['user']['id']):
+        return jsonify({'success': False, 'message': 'Permission denied'}), 403
+    
+    if db is None:
+        return jsonify({'success': False, 'message': 'Database unavailable'}), 500
+    
+    fmt = (request.args.get('format') or 'ndjson').lower()
+    if fmt not in CONFIG_TRANSFER_FORMATS:
+        return jsonify({'success': False, 'message': f'Unsupported format: {fmt}'}), 400
+    
+    mimetype = 'application/bson' if fmt == 'bson' else 'application/x-ndjson'
+    filename = f"guild_configs_{datetime.utcnow().strftime('%Y%m%d%H%M%S')}.{fmt}"
+    return Response(
+        stream_with_context(iter_config_export(fmt, get_requested_guild_ids())),
+        mimetype=mimetype,
+        headers={'Content-Disposition': f'attachment; filename={filename}'}
+    )
+
+@app.route('/import_configs', methods=['POST'])
+@login_required
+def import_configs_route():
+    if not user_is_owner(session['user']['id']):
+        return jsonify({'success': False, 'message': 'Permission denied'}), 403
+    
+    if db is None:
+        return jsonify({'success': False, 'message': 'Database unavailable'}), 500
+    
+    fmt = get_transfer_format()
+    if fmt is None:
+        return jsonify({'success': False, 'message': 'Content-Type must be application/x-ndjson or application/bson'}), 415
+    
+    try:
+        stats = import_configs(iter_config_import_documents(request.stream, fmt))
+        print(f"Config import result: {stats}")
+        if stats['error']:
+            return jsonify({'success': False, 'message': f"Import stopped: {stats['error']}", **stats}), 400
+        return jsonify({'success': True, 'message': 'Configurations imported successfully', **stats})
+    except Exception as e:
+        print(f"Error importing configs: {e}")
+        import traceback
+        traceback.print_exc()
+        return jsonify({'success': False, 'message': str(e)}), 500
+
 @app.route('/invite')
 def invite():
     bot_info = get_bot_info()
@@ -632,6 +822,35 @@ def health():
 def ping():
     return "pong", 200, {"Content-Type": "text/plain; charset=utf-8"}
 
+@app.cli.command('export-configs')
+@click.option('--format', 'fmt', type=click.Choice(CONFIG_TRANSFER_FORMATS), default='ndjson')
+@click.option('--guild-id', 'guild_ids', multiple=True, help='Only export these guilds (repeatable).')
+@click.option('--output', required=True, type=click.Path(dir_okay=False, writable=True),
+              help='Destination file. Stdout is not supported because startup logging is printed there.')
+def export_configs_command(fmt, guild_ids, output):
+    """Stream guild configs to a NDJSON or BSON file."""
+    if db is None:
+        raise click.ClickException('Database unavailable')
+    count = 0
+    with open(output, 'wb') as f:
+        for chunk in iter_config_export(fmt, list(guild_ids)):
+            f.write(chunk if isinstance(chunk, bytes) else chunk.encode('utf-8'))
+            count += 1
+    click.echo(f"Exported {count} guild configs to {output}", err=True)
+
+@app.cli.command('import-configs')
+@click.option('--format', 'fmt', type=click.Choice(CONFIG_TRANSFER_FORMATS), default='ndjson')
+@click.argument('source', type=click.Path(exists=True, dir_okay=False))
+def import_configs_command(fmt, source):
+    """Restore guild configs from a NDJSON or BSON file, replacing existing ones."""
+    if db is None:
+        raise click.ClickException('Database unavailable')
+    with open(source, 'rb') as f:
+        stats = import_configs(iter_config_import_documents(f, fmt))
+    click.echo(f"Config import result: {stats}", err=True)
+    if stats['error']:
+        raise click.ClickException(f"Import stopped: {stats['error']}")
+
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
     print(f"Starting Flask app on port {port}")